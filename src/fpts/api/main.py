@@ -1,28 +1,56 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from pydantic import BaseModel
 
-from fpts.api.routers.debug import router as debug_router
+import fpts.api.schemas as api_schemas
 from fpts.api.routers.health import router as health_router
-from fpts.api.routers.metrics import router as metrics_router
 from fpts.api.routers.phenology import router as phenology_router
-from fpts.api.wiring import wire_in_memory_services, wire_postgis_services
-from fpts.config.settings import Settings
+from fpts.config.settings import Settings, default_settings
 from fpts.utils.logging import get_logger, setup_logging
-from fpts.utils.metrics import PrometheusMetricsMiddleware
 from fpts.utils.middleware import RequestLoggingMiddleware
 
 logger = get_logger(__name__)
 
 
+def _api_schemas() -> list[type[BaseModel]]:
+    """
+    Every Pydantic model defined in fpts.api.schemas, including ones only used as
+    nested fields, so new schemas are picked up without a hand-kept list here.
+    """
+    return [
+        obj
+        for obj in vars(api_schemas).values()
+        if isinstance(obj, type)
+        and issubclass(obj, BaseModel)
+        and obj.__module__ == api_schemas.__name__
+    ]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # API schemas use defer_build; build them at server startup so the first request
+    # doesn't pay for it. Plain create_app() calls (e.g. test fixtures) stay cheap.
+    for schema in _api_schemas():
+        schema.model_rebuild()
+    yield
+
+
 def create_app(settings: Settings | None = None) -> FastAPI:
-    settings = settings or Settings()
+    settings = settings or default_settings()
     setup_logging(level=settings.log_level, json=(settings.environment == "production"))
 
-    app = FastAPI(title=settings.app_name)
+    app = FastAPI(title=settings.app_name, lifespan=lifespan)
     app.state.settings = settings
 
+    # Backends, metrics and debug routes are imported only when selected by settings.
     if settings.phenology_repo_backend == "postgis":
+        from fpts.api.wiring import wire_postgis_services
+
         wire_postgis_services(app, settings=settings)
     else:
+        from fpts.api.wiring import wire_in_memory_services
+
         wire_in_memory_services(app, settings=settings)
 
     # Routers and middleware
@@ -32,10 +60,15 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     app.add_middleware(RequestLoggingMiddleware)
 
     if settings.enable_metrics:
+        from fpts.api.routers.metrics import router as metrics_router
+        from fpts.utils.metrics import PrometheusMetricsMiddleware
+
         app.add_middleware(PrometheusMetricsMiddleware)
         app.include_router(metrics_router)
 
     if settings.enable_debug_routes or settings.environment != "production":
+        from fpts.api.routers.debug import router as debug_router
+
         app.include_router(debug_router)
 
     return app
@@ -1,17 +1,17 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from fpts.api.dependencies import get_settings
 from fpts.config.settings import Settings
 from fpts.utils.logging import get_logger
 
 logger = get_logger(__name__)
-settings = Settings()
 
 
 router = APIRouter()
 
 
 @router.get("/health")
-def health_check():
+def health_check(settings: Settings = Depends(get_settings)):
     logger.info("Health check endpoint called.")
     return {
         "status": "ok",
@@ -1,6 +1,9 @@
+from functools import partial
 from typing import Literal
 
+import anyio
 from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.responses import Response
 
 from fpts.api.dependencies import get_phenology_compute_service, get_query_service
 from fpts.api.schemas import (
@@ -23,14 +26,19 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/phenology", tags=["phenology"])
 
 
-@router.get("/point", response_model=PhenologyPointResponse)
-def get_point_phenology(
-    lat: float = Query(
-        ..., ge=-90.0, le=90.0, description="Latitude value for the point."
-    ),
-    lon: float = Query(
-        ..., ge=-180.0, le=180.0, description="Longitude value for the point."
-    ),
+@router.get(
+    "/point",
+    response_model=None,
+    responses={
+        200: {"model": PhenologyPointResponse},
+        404: {"description": "No data found"},
+        400: {"description": "Invalid parameters"},
+    },
+)
+async def get_point_phenology(
+    # lat/lon bounds are enforced once by Location, not by Query validators
+    lat: float = Query(..., description="Latitude value for the point."),
+    lon: float = Query(..., description="Longitude value for the point."),
     year: int = Query(..., ge=2000, le=2027, description="Year we want to analyse."),
     mode: Literal["repo", "compute", "auto"] = Query(
         "repo",
@@ -51,7 +59,7 @@ def get_point_phenology(
     compute_service: PhenologyComputationService = Depends(
         get_phenology_compute_service
     ),
-):
+) -> Response:
     """
     Get phenology metrics for a single point.
 
@@ -70,11 +78,19 @@ def get_point_phenology(
         f"mode: {mode}, product: {product}, threshold_frac: {threshold_frac}"
     )
 
-    location = Location(lat=lat, lon=lon)
+    try:
+        location = Location(lat=lat, lon=lon)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
     if mode == "repo":
-        metric = query_service.get_point_metric(
-            product=product, location=location, year=year
+        metric = await anyio.to_thread.run_sync(
+            partial(
+                query_service.get_point_metric,
+                product=product,
+                location=location,
+                year=year,
+            )
         )
         if metric is None:
             raise HTTPException(
@@ -87,38 +103,56 @@ def get_point_phenology(
 
     elif mode == "compute":
         try:
-            metric = compute_service.compute_point_phenology(
-                product=product,
-                year=year,
-                location=location,
-                threshold_frac=threshold_frac,
+            metric = await anyio.to_thread.run_sync(
+                partial(
+                    compute_service.compute_point_phenology,
+                    product=product,
+                    year=year,
+                    location=location,
+                    threshold_frac=threshold_frac,
+                )
             )
         except FileNotFoundError as e:
             raise HTTPException(status_code=404, detail=str(e)) from e
 
     else:  # mode == "auto"
-        metric = query_service.get_point_metric(
-            product=product, location=location, year=year
+        metric = await anyio.to_thread.run_sync(
+            partial(
+                query_service.get_point_metric,
+                product=product,
+                location=location,
+                year=year,
+            )
         )
         if metric is None:
             try:
-                metric = compute_service.compute_point_phenology(
-                    product=product,
-                    year=year,
-                    location=location,
-                    threshold_frac=threshold_frac,
+                metric = await anyio.to_thread.run_sync(
+                    partial(
+                        compute_service.compute_point_phenology,
+                        product=product,
+                        year=year,
+                        location=location,
+                        threshold_frac=threshold_frac,
+                    )
                 )
             except FileNotFoundError as e:
                 raise HTTPException(status_code=404, detail=str(e)) from e
 
-    return PhenologyPointResponse(
+    # Validation is skipped: every field comes from a PhenologyMetric built by our
+    # own services, and Location already enforced the lat/lon bounds.
+    response = PhenologyPointResponse.model_construct(
         year=metric.year,
-        location=LocationSchema(lat=metric.location.lat, lon=metric.location.lon),
+        location=LocationSchema.model_construct(
+            lat=metric.location.lat, lon=metric.location.lon
+        ),
         sos_date=metric.sos_date,
         eos_date=metric.eos_date,
         season_length=metric.season_length,
         is_forest=metric.is_forest,
     )
+    # Serialize directly instead of via response_model, so FastAPI does not
+    # re-validate a model we have just built. OpenAPI still documents it via `responses`.
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.post("/points", response_model=list[PhenologyPointResponse])
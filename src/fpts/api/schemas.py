@@ -9,7 +9,7 @@ class LocationSchema(BaseModel):
     lat: float = Field(..., ge=-90.0, le=90.0)
     lon: float = Field(..., ge=-180.0, le=180.0)
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(defer_build=True)
 
 
 class PhenologyYearMetricSchema(BaseModel):
@@ -19,7 +19,7 @@ class PhenologyYearMetricSchema(BaseModel):
     season_length: Optional[int] = None
     is_forest: bool
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class SeasonLengthStat(str, Enum):
@@ -46,13 +46,13 @@ class GeoJSONPolygonRequest(BaseModel):
 
         return val
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class PhenologyPointsRequest(BaseModel):
     locations: list[LocationSchema] = Field(..., min_length=1)
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class PhenologyAreaStatsResponse(BaseModel):
@@ -64,7 +64,7 @@ class PhenologyAreaStatsResponse(BaseModel):
     median_season_length: float | None = None
     forest_fraction: float | None = None
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class PhenologyPointResponse(BaseModel):
@@ -80,7 +80,7 @@ class PhenologyPointResponse(BaseModel):
     season_length: Optional[int] = None
     is_forest: bool
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(defer_build=True)
 
 
 class PhenologyTimeseriesResponse(BaseModel):
@@ -90,4 +90,4 @@ class PhenologyTimeseriesResponse(BaseModel):
     end_year: int
     metrics: list[PhenologyYearMetricSchema]
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, defer_build=True)
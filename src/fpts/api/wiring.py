@@ -1,3 +1,4 @@
+from fpts.cache.keys import PointMetricCacheKey
 from fpts.cache.ttl_cache import InMemoryTTLCache
 from fpts.config.settings import Settings
 from fpts.domain.models import PhenologyMetric
@@ -6,7 +7,6 @@ from fpts.processing.raster_service import RasterService
 from fpts.query.service import QueryService
 from fpts.storage.in_memory_repository import InMemoryPhenologyRepository
 from fpts.storage.local_raster_repository import LocalRasterRepository
-from fpts.storage.postgis_phenology_repository import PostGISPhenologyRepository
 
 
 def wire_in_memory_services(app, settings: Settings) -> None:
@@ -14,7 +14,7 @@ def wire_in_memory_services(app, settings: Settings) -> None:
     Wiring for development/testing.
     """
     # Create caches
-    app.state.point_metric_cache = InMemoryTTLCache[str, PhenologyMetric](
+    app.state.point_metric_cache = InMemoryTTLCache[PointMetricCacheKey, PhenologyMetric](
         maxsize=50_000,
         ttl_seconds=300.0,
     )
@@ -45,8 +45,11 @@ def wire_postgis_services(app, settings: Settings) -> None:
     """
     Wiring for Production.
     """
+    # Imported here so the in-memory backend does not pull in psycopg.
+    from fpts.storage.postgis_phenology_repository import PostGISPhenologyRepository
+
     # Create caches
-    app.state.point_metric_cache = InMemoryTTLCache[str, PhenologyMetric](
+    app.state.point_metric_cache = InMemoryTTLCache[PointMetricCacheKey, PhenologyMetric](
         maxsize=50_000,
         ttl_seconds=300.0,
     )
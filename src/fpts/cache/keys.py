@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from fpts.domain.models import Location
 
+# (source, product, year, lat, lon, threshold_frac)
+PointMetricCacheKey = tuple[str, str, int, float, float, float | None]
+
 
 def point_metric_cache_key(
     *,
@@ -10,14 +13,15 @@ def point_metric_cache_key(
     year: int,
     location: Location,
     threshold_frac: float | None,
-) -> str:
+) -> PointMetricCacheKey:
     """
     Normalize floats so equivalent requests map to the same key.
 
     - lat/lon rounded to 6dp: ~0.11m precision at equator (more than enough here)
     - threshold rounded to 3dp
+
+    The tuple itself is the key: cheaper than formatting a str, and dict lookups
+    still compare it for equality, so hash collisions can't alias two requests.
     """
-    lat = round(location.lat, 6)
-    lon = round(location.lon, 6)
     thr = None if threshold_frac is None else round(threshold_frac, 3)
-    return f"phenology:point:{source}:{product}:{year}:{lat}:{lon}:{thr}"
+    return (source, product, year, round(location.lat, 6), round(location.lon, 6), thr)
@@ -3,7 +3,7 @@ from datetime import date
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Location:
     """
     A Geographic location in WGS84 (Latitude/ Longitude) coordinates.
@@ -16,10 +16,10 @@ class Location:
         if not (-90.0 <= self.lat <= 90.0):
             raise ValueError(f"Latitude must be between -90 and 90, got {self.lat}")
         if not (-180.0 <= self.lon <= 180.0):
-            raise ValueError(f"Longitude bust be between -180 and 180, got {self.lon}")
+            raise ValueError(f"Longitude must be between -180 and 180, got {self.lon}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PhenologyMetric:
     """
     Phenology metrics for a given location and year.
@@ -3,21 +3,43 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Iterable
 
 import requests
 from pystac_client import Client
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     import planetary_computer as pc
 except Exception:
     pc = None
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 from fpts.config.settings import Settings
 
+# Signing is an HTTPS round-trip per item, so overlap them.
+_SIGN_MAX_WORKERS = 16
+
+# Shared session so asset downloads reuse keep-alive connections to blob storage
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    ),
+)
+
 
 def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
     """
@@ -30,10 +52,15 @@ def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
     return hash.hexdigest()
 
 
+def _sign_item(item: Any) -> dict[str, Any]:
+    # sign each item to get SAS URLs
+    return pc.sign(item).to_dict()
+
+
 def _doy_from_iso(dt: str) -> int:
-    # dt is typically like "2020-01-01T00:00:00Z"
-    d = datetime.fromisoformat(dt.replace("Z", "+00:00")).date()
-    return int(d.strftime("%j"))
+    # dt is typically like "2020-01-01T00:00:00Z"; the date part is always the first 10 chars
+    d = date.fromisoformat(dt[:10])
+    return (d - date(d.year, 1, 1)).days + 1
 
 
 def download_to_path(
@@ -49,7 +76,7 @@ def download_to_path(
     hash = hashlib.sha256()
     nbytes = 0
 
-    with requests.get(url, stream=True, timeout=timeout_s) as r:
+    with _SESSION.get(url, stream=True, timeout=timeout_s) as r:
         r.raise_for_status()
         with tmp_path.open("wb") as f:
             for chunk in r.iter_content(chunk_size=1024 * 1024):
@@ -132,9 +159,11 @@ class Mod13Q1IngestionService:
         )
         items = list(search.items())
 
+        with ThreadPoolExecutor(max_workers=_SIGN_MAX_WORKERS) as executor:
+            signed_items = list(executor.map(_sign_item, items))
+
         assets: list[Mod13Q1AssetRef] = []
-        for item in items:
-            signed = pc.sign(item).to_dict()  # sign each item to get SAS URLs
+        for signed in signed_items:
             props = signed.get("properties", {})
             dt = props.get("datetime")
             if not dt:
@@ -230,4 +259,10 @@ class Mod13Q1IngestionService:
     def write_manifest(self, plan: Mod13Q1Plan, out_path: Path) -> None:
         out_path.parent.mkdir(parents=True, exist_ok=True)
         payload = asdict(plan)
-        out_path.write_text(json.dumps(payload, indent=2, sort_keys=True))
+        if orjson is not None:
+            # much faster than stdlib json for manifests with thousands of assets
+            out_path.write_bytes(
+                orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+            )
+        else:
+            out_path.write_text(json.dumps(payload, indent=2, sort_keys=True))
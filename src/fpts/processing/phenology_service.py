@@ -5,7 +5,7 @@ from typing import Optional, Sequence
 
 import xarray as xr
 
-from fpts.cache.keys import point_metric_cache_key
+from fpts.cache.keys import PointMetricCacheKey, point_metric_cache_key
 from fpts.cache.ttl_cache import InMemoryTTLCache
 from fpts.domain.models import Location, PhenologyMetric
 from fpts.processing.ndvi_stack import (
@@ -33,7 +33,7 @@ class PhenologyComputationService:
     def __init__(
         self,
         raster_repo: RasterRepository,
-        point_cache: InMemoryTTLCache[str, PhenologyMetric] | None = None,
+        point_cache: InMemoryTTLCache[PointMetricCacheKey, PhenologyMetric] | None = None,
     ) -> None:
         self._raster_repo = raster_repo
         self._stack_cache: dict[tuple[str, int], xr.DataArray] = {}
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from fpts.cache.keys import point_metric_cache_key
+from fpts.cache.keys import PointMetricCacheKey, point_metric_cache_key
 from fpts.cache.ttl_cache import InMemoryTTLCache
 from fpts.domain.models import Location, PhenologyMetric
 from fpts.storage.phenology_repository import PhenologyRepository
@@ -19,7 +19,7 @@ class QueryService:
     def __init__(
         self,
         repository: PhenologyRepository,
-        point_cache: InMemoryTTLCache[str, PhenologyMetric] | None = None,
+        point_cache: InMemoryTTLCache[PointMetricCacheKey, PhenologyMetric] | None = None,
     ) -> None:
         self._repository = repository
         self._point_cache = point_cache
@@ -30,23 +30,27 @@ class QueryService:
         """
         Return phenology metric for a single location and year, or None if not found
         """
-        if self._point_cache is not None:
-            key = point_metric_cache_key(
-                source="repo",
-                product=product,
-                year=year,
-                location=location,
-                threshold_frac=None,
+        if self._point_cache is None:
+            return self._repository.get_metric_for_location(
+                product=product, location=location, year=year
             )
-            cached = self._point_cache.get(key)
-            if cached is not None:
-                return cached
+
+        key = point_metric_cache_key(
+            source="repo",
+            product=product,
+            year=year,
+            location=location,
+            threshold_frac=None,
+        )
+        cached = self._point_cache.get(key)
+        if cached is not None:
+            return cached
 
         metric = self._repository.get_metric_for_location(
             product=product, location=location, year=year
         )
 
-        if metric is not None and self._point_cache is not None:
+        if metric is not None:
             self._point_cache.set(key, metric)
 
         return metric
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import Sequence
 
@@ -17,12 +18,18 @@ class LocalRasterRepository(RasterRepository):
 
     def __init__(self, data_dir: str | Path) -> None:
         self._data_dir = Path(data_dir)
+        self._data_dir_str = os.fspath(self._data_dir)
+
+    def _raw_raster_path_str(self, product: str, year: int) -> str:
+        # single source of truth for the {data_dir}/raw/{product}/{year}.tif layout
+        return os.path.join(self._data_dir_str, "raw", product, f"{year}.tif")
 
     def raw_raster_path(self, product: str, year: int) -> Path:
-        return self._data_dir / "raw" / product / f"{year}.tif"
+        return Path(self._raw_raster_path_str(product, year))
 
     def exists(self, product: str, year: int) -> bool:
-        return self.raw_raster_path(product, year).exists()
+        # plain str path + os.path.exists: skips building a Path on every call
+        return os.path.exists(self._raw_raster_path_str(product, year))
 
     def list_ndvi_stack_paths(self, product: str, year: int) -> Sequence[Path]:
         stack_dir = self._data_dir / "raw" / product / str(year)
@@ -101,3 +101,37 @@ def test_phenology_point_auto_mode_returns_200(app_memory):
     )
 
     assert resp.status_code == 200
+
+
+def test_phenology_point_returns_400_for_out_of_range_latitude(app_memory):
+    client = TestClient(app_memory)
+    resp = client.get(
+        "/phenology/point",
+        params={
+            "product": "ndvi_synth",
+            "lat": 95.0,
+            "lon": 10.0,
+            "year": 2020,
+            "mode": "repo",
+        },
+    )
+
+    assert resp.status_code == 400
+    assert "Latitude must be between -90 and 90" in resp.json()["detail"]
+
+
+def test_phenology_point_returns_400_for_out_of_range_longitude(app_memory):
+    client = TestClient(app_memory)
+    resp = client.get(
+        "/phenology/point",
+        params={
+            "product": "ndvi_synth",
+            "lat": 40.0,
+            "lon": 190.0,
+            "year": 2020,
+            "mode": "repo",
+        },
+    )
+
+    assert resp.status_code == 400
+    assert "Longitude must be between -180 and 180" in resp.json()["detail"]
@@ -0,0 +1,21 @@
+from fastapi.testclient import TestClient
+
+from fpts.api.main import _api_schemas, create_app
+from fpts.api.schemas import LocationSchema, PhenologyPointResponse
+from fpts.config.settings import Settings
+
+
+def test_api_schemas_are_discovered_from_schemas_module():
+    schemas = _api_schemas()
+
+    # LocationSchema is only ever used nested inside other models
+    assert LocationSchema in schemas
+    assert PhenologyPointResponse in schemas
+
+
+def test_startup_builds_deferred_api_schemas():
+    app = create_app(Settings(phenology_repo_backend="memory"))
+
+    # Entering the client runs the lifespan startup
+    with TestClient(app):
+        assert all(schema.__pydantic_complete__ for schema in _api_schemas())
@@ -0,0 +1,43 @@
+from fpts.cache.keys import point_metric_cache_key
+from fpts.domain.models import Location
+
+
+def test_point_metric_cache_key_normalizes_equivalent_requests():
+    a = point_metric_cache_key(
+        source="compute",
+        product="ndvi_synth",
+        year=2020,
+        location=Location(lat=51.4950001, lon=-0.495),
+        threshold_frac=0.5,
+    )
+    b = point_metric_cache_key(
+        source="compute",
+        product="ndvi_synth",
+        year=2020,
+        location=Location(lat=51.495, lon=-0.495),
+        threshold_frac=0.5000001,
+    )
+
+    assert a == b
+
+
+def test_point_metric_cache_key_separates_repo_and_compute():
+    kwargs = dict(
+        product="ndvi_synth",
+        year=2020,
+        location=Location(lat=51.495, lon=-0.495),
+        threshold_frac=None,
+    )
+
+    assert point_metric_cache_key(source="repo", **kwargs) != point_metric_cache_key(
+        source="compute", **kwargs
+    )
+
+
+def test_point_metric_cache_key_distinguishes_hash_colliding_floats():
+    # hash(-1.0) == hash(-2.0) in CPython; the keys must still differ
+    kwargs = dict(source="repo", product="ndvi_synth", year=2020, threshold_frac=None)
+
+    assert point_metric_cache_key(
+        location=Location(lat=-1.0, lon=10.0), **kwargs
+    ) != point_metric_cache_key(location=Location(lat=-2.0, lon=10.0), **kwargs)
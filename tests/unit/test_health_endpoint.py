@@ -0,0 +1,16 @@
+from fastapi.testclient import TestClient
+
+from fpts.api.main import create_app
+from fpts.config.settings import Settings
+
+
+def test_health_reports_app_settings():
+    app = create_app(
+        Settings(phenology_repo_backend="memory", environment="staging", log_level="debug")
+    )
+    client = TestClient(app)
+
+    resp = client.get("/health")
+
+    assert resp.status_code == 200
+    assert resp.json() == {"status": "ok", "environment": "staging", "log_level": "debug"}
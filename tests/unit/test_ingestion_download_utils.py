@@ -1,9 +1,51 @@
+import hashlib
 from pathlib import Path
 
-from fpts.ingestion.mod13q1 import sha256_file
+import fpts.ingestion.mod13q1 as mod13q1
+from fpts.ingestion.mod13q1 import download_to_path, sha256_file
 
 
 def test_sha256_file_is_deterministic(tmp_path: Path) -> None:
     p = tmp_path / "x.bin"
     p.write_bytes(b"abc")
     assert sha256_file(p) == sha256_file(p)
+
+
+class _FakeStreamingResponse:
+    def __init__(self, chunks: list[bytes]) -> None:
+        self._chunks = chunks
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def iter_content(self, chunk_size: int):
+        return iter(self._chunks)
+
+
+def test_download_to_path_streams_through_shared_session(
+    tmp_path: Path, monkeypatch
+) -> None:
+    chunks = [b"abc", b"", b"def"]
+    calls: list[tuple[str, dict]] = []
+
+    def _fake_get(url, **kwargs):
+        calls.append((url, kwargs))
+        return _FakeStreamingResponse(chunks)
+
+    monkeypatch.setattr(mod13q1._SESSION, "get", _fake_get)
+
+    out = tmp_path / "raw" / "doy_001.tif"
+    digest, nbytes = download_to_path("https://example.com/a.tif", out, timeout_s=5.0)
+
+    assert calls == [("https://example.com/a.tif", {"stream": True, "timeout": 5.0})]
+    assert out.read_bytes() == b"abcdef"
+    assert digest == hashlib.sha256(b"abcdef").hexdigest()
+    assert nbytes == 6
+    # atomic write: the .partial file is renamed into place
+    assert not out.with_suffix(".tif.partial").exists()
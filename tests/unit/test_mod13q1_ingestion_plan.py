@@ -5,3 +5,8 @@ def test_doy_from_iso_handles_leap_year() -> None:
     assert _doy_from_iso("2020-01-01T00:00:00Z") == 1
     assert _doy_from_iso("2020-02-29T00:00:00Z") == 60
     assert _doy_from_iso("2020-12-31T00:00:00Z") == 366
+
+
+def test_doy_from_iso_ignores_time_and_offset() -> None:
+    assert _doy_from_iso("2021-03-01") == 60
+    assert _doy_from_iso("2021-03-01T23:30:00-05:00") == 60
@@ -104,3 +104,18 @@ def test_write_manifest_is_json(tmp_path: Path):
     loaded = json.loads(out.read_text())
     assert loaded["year"] == 2020
     assert loaded["assets"][0]["item_id"] == "x"
+
+
+def test_write_manifest_falls_back_to_stdlib_json(tmp_path: Path, monkeypatch):
+    from fpts.ingestion.mod13q1 import Mod13Q1Plan
+
+    monkeypatch.setattr(mod13q1, "orjson", None)
+    svc = Mod13Q1IngestionService(settings=Settings())
+
+    pl = Mod13Q1Plan(collection="c", year=2020, bbox=(0.0, 0.0, 1.0, 1.0), assets=[])
+    out = tmp_path / "manifest.json"
+    svc.write_manifest(pl, out)
+
+    loaded = json.loads(out.read_text())
+    assert loaded["bbox"] == [0.0, 0.0, 1.0, 1.0]
+    assert loaded["assets"] == []
@@ -1,5 +1,7 @@
 from datetime import date
 
+from fpts.cache.keys import PointMetricCacheKey
+from fpts.cache.ttl_cache import InMemoryTTLCache
 from fpts.domain.models import Location, PhenologyMetric
 from fpts.query.service import QueryService
 from fpts.storage.in_memory_repository import InMemoryPhenologyRepository
@@ -70,3 +72,63 @@ def test_query_service_timeseries_returns_sorted_metrics():
         product="test_product", location=loc, start_year=2018, end_year=2022
     )
     assert [m.year for m in result] == [2019, 2021]
+
+
+def test_query_service_serves_repeat_lookups_from_point_cache():
+    repo = InMemoryPhenologyRepository()
+    cache = InMemoryTTLCache[PointMetricCacheKey, PhenologyMetric](maxsize=10, ttl_seconds=60.0)
+    service = QueryService(repository=repo, point_cache=cache)
+
+    loc = Location(lat=52.5, lon=13.4)
+    metric = PhenologyMetric(
+        year=2020,
+        location=loc,
+        sos_date=date(2020, 4, 15),
+        eos_date=date(2020, 10, 15),
+        season_length=(date(2020, 10, 15) - date(2020, 4, 15)).days,
+        is_forest=True,
+    )
+    repo.add_metric(product="test_product", metric=metric)
+
+    first = service.get_point_metric(product="test_product", location=loc, year=2020)
+
+    # A service over an empty repo can only answer from the shared cache
+    empty_service = QueryService(
+        repository=InMemoryPhenologyRepository(), point_cache=cache
+    )
+    second = empty_service.get_point_metric(
+        product="test_product", location=loc, year=2020
+    )
+
+    assert first == metric
+    assert second == metric
+
+
+def test_query_service_point_cache_keeps_hash_colliding_locations_apart():
+    repo = InMemoryPhenologyRepository()
+    cache = InMemoryTTLCache[PointMetricCacheKey, PhenologyMetric](
+        maxsize=10, ttl_seconds=60.0
+    )
+    service = QueryService(repository=repo, point_cache=cache)
+
+    # hash(-1.0) == hash(-2.0) in CPython
+    loc_a = Location(lat=-1.0, lon=10.0)
+    loc_b = Location(lat=-2.0, lon=10.0)
+    for loc, season_length in ((loc_a, 100), (loc_b, 200)):
+        repo.add_metric(
+            product="test_product",
+            metric=PhenologyMetric(
+                year=2020,
+                location=loc,
+                sos_date=None,
+                eos_date=None,
+                season_length=season_length,
+                is_forest=True,
+            ),
+        )
+
+    a = service.get_point_metric(product="test_product", location=loc_a, year=2020)
+    b = service.get_point_metric(product="test_product", location=loc_b, year=2020)
+
+    assert a is not None and a.season_length == 100
+    assert b is not None and b.season_length == 200
@@ -10,3 +10,13 @@ def test_local_raster_repository_builds_expected_path(tmp_path: Path):
 
     assert p == tmp_path / "raw" / "mcd12q2" / "2020.tif"
     assert repo.exists(product="mcd12q2", year=2020) is False
+
+
+def test_local_raster_repository_exists_when_file_present(tmp_path: Path):
+    repo = LocalRasterRepository(data_dir=tmp_path)
+
+    p = repo.raw_raster_path(product="mcd12q2", year=2020)
+    p.parent.mkdir(parents=True)
+    p.write_bytes(b"")
+
+    assert repo.exists(product="mcd12q2", year=2020) is True
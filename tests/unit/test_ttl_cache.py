@@ -0,0 +1,82 @@
+import fpts.cache.ttl_cache as ttl_cache
+from fpts.cache.ttl_cache import InMemoryTTLCache
+
+
+class _FakeClock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(ttl_cache.time, "monotonic", clock)
+
+    cache = InMemoryTTLCache[str, int](maxsize=10, ttl_seconds=5.0)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    clock.now += 5.0
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = InMemoryTTLCache[str, int](maxsize=2, ttl_seconds=60.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Touch "a" so "b" becomes the least recently used entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_overwrite_marks_key_recently_used():
+    cache = InMemoryTTLCache[str, int](maxsize=2, ttl_seconds=60.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Overwriting "a" must refresh its position, leaving "b" as the LRU entry
+    cache.set("a", 10)
+    cache.set("c", 3)
+
+    assert cache.get("a") == 10
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_periodic_sweep_drops_unread_expired_entries(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(ttl_cache.time, "monotonic", clock)
+
+    cache = InMemoryTTLCache[str, int](maxsize=10, ttl_seconds=5.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    clock.now += 5.0
+
+    # Never read "a" or "b" again; writes to another key trigger the sweep
+    for i in range(ttl_cache._SWEEP_INTERVAL):
+        cache.set("c", i)
+
+    assert len(cache) == 1
+    assert cache.get("c") == ttl_cache._SWEEP_INTERVAL - 1
+
+
+def test_ttl_cache_get_does_not_sweep(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(ttl_cache.time, "monotonic", clock)
+
+    cache = InMemoryTTLCache[str, int](maxsize=10, ttl_seconds=5.0)
+    cache.set("a", 1)
+    clock.now += 5.0
+
+    for _ in range(ttl_cache._SWEEP_INTERVAL):
+        cache.get("missing")
+
+    # Only set() sweeps; the hit path stays lookup + expiry check + LRU touch
+    assert len(cache) == 1